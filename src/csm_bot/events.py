@@ -10,7 +10,7 @@ from csm_bot.models import (
     ACCOUNTING_ABI,
 )
 from csm_bot.models import CSM_ABI
-from csm_bot.texts import EVENT_MESSAGES, EVENT_MESSAGE_FOOTER, EVENT_MESSAGE_FOOTER_TX_ONLY, EVENT_EMITS
+from csm_bot.texts import EVENT_MESSAGES, event_message_footer, event_message_footer_tx_only, EVENT_EMITS
 
 # This is a dictionary that will be populated with the events to follow
 EVENTS_TO_FOLLOW = {}
@@ -69,8 +69,8 @@ class EventMessages:
     def footer(event: Event):
         tx_link = ETHERSCAN_TX_URL_TEMPLATE.format("0x" + event.tx.hex())
         if 'nodeOperatorId' not in event.args:
-            return EVENT_MESSAGE_FOOTER_TX_ONLY(tx_link).as_markdown()
-        return EVENT_MESSAGE_FOOTER(event.args['nodeOperatorId'], tx_link).as_markdown()
+            return event_message_footer_tx_only(tx_link)
+        return event_message_footer(event.args['nodeOperatorId'], tx_link)
 
     @RegisterEvent('DepositedSigningKeysCountChanged')
     async def deposited_signing_keys_count_changed(self, event: Event):
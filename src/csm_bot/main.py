@@ -65,31 +65,37 @@ class TelegramSubscription(Subscription):
 
     async def handle_event_log(self, event: Event, context: ContextTypes.DEFAULT_TYPE):
         logger.info("Handle event on the block %s: %s", event.block, event.readable())
-        actual_chat_ids = (context.bot_data.get("user_ids", set())
-                           .union(context.bot_data.get("group_ids", set()))
-                           .union(context.bot_data.get("channel_ids", set())))
+        user_ids = context.bot_data.get("user_ids", set())
+        group_ids = context.bot_data.get("group_ids", set())
+        channel_ids = context.bot_data.get("channel_ids", set())
         if "nodeOperatorId" in event.args:
-            chats = context.bot_data["no_ids_to_chats"].get(str(event.args["nodeOperatorId"]), set())
+            subscribed = context.bot_data["no_ids_to_chats"].get(str(event.args["nodeOperatorId"]), set())
         else:
             # all chats that subscribed to any node operator
-            chats = set(chain(*context.bot_data["no_ids_to_chats"].values()))
-        chats = chats.intersection(actual_chat_ids)
+            subscribed = chain(*context.bot_data["no_ids_to_chats"].values())
+        # walk the subscribers and probe the chat sets rather than building their union first
+        chats = {chat for chat in subscribed if chat in user_ids or chat in group_ids or chat in channel_ids}
 
         message = await eventMessages.get_event_message(event)
 
-        sent_messages = 0
-        for chat in chats:
-            try:
-                await context.bot.send_message(chat_id=chat,
-                                               text=message,
-                                               parse_mode=ParseMode.MARKDOWN_V2,
-                                               link_preview_options=LinkPreviewOptions(is_disabled=True))
-                sent_messages += 1
-            except Exception as e:
-                logger.error("Error sending message to chat %s: %s", chat, e)
+        # the rate limiter paces concurrent sends, so fan out to all chats at once
+        results = await asyncio.gather(*(self.send_event_message(context, chat, message) for chat in chats))
+        sent_messages = sum(results)
         if sent_messages:
             logger.info("Messages sent: %s", sent_messages)
 
+    @staticmethod
+    async def send_event_message(context: ContextTypes.DEFAULT_TYPE, chat: int, message: str) -> bool:
+        try:
+            await context.bot.send_message(chat_id=chat,
+                                           text=message,
+                                           parse_mode=ParseMode.MARKDOWN_V2,
+                                           link_preview_options=LinkPreviewOptions(is_disabled=True))
+            return True
+        except Exception as e:
+            logger.error("Error sending message to chat %s: %s", chat, e)
+            return False
+
     async def process_new_block(self, block: Block):
         await application.update_queue.put(block)
 
@@ -98,6 +104,10 @@ class TelegramSubscription(Subscription):
         application.bot_data['block'] = block.number
 
 
+def _format_node_operator_ids(node_operator_ids):
+    return ', '.join(f"#{node_operator_id}" for node_operator_id in node_operator_ids)
+
+
 async def chat_migration(update, context):
     message = update.message
     context.application.migrate_chat_data(message=message)
@@ -185,7 +195,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = WELCOME_TEXT
     node_operator_ids = sorted(context.chat_data.get('node_operators', {}))
     if node_operator_ids:
-        text += FOLLOW_NODE_OPERATOR_FOLLOWING.format(', '.join(map(lambda x: f"#{x}", node_operator_ids)))
+        text += FOLLOW_NODE_OPERATOR_FOLLOWING.format(_format_node_operator_ids(node_operator_ids))
 
     reply_markup = InlineKeyboardMarkup(keyboard)
     await context.bot.send_message(
@@ -208,7 +218,7 @@ async def start_over(update: Update, context: ContextTypes.DEFAULT_TYPE):
     text = WELCOME_TEXT
     node_operator_ids = sorted(context.chat_data.get('node_operators', {}))
     if node_operator_ids:
-        text += FOLLOW_NODE_OPERATOR_FOLLOWING.format(', '.join(map(lambda x: f"#{x}", node_operator_ids)))
+        text += FOLLOW_NODE_OPERATOR_FOLLOWING.format(_format_node_operator_ids(node_operator_ids))
 
     reply_markup = InlineKeyboardMarkup(keyboard)
     await update.callback_query.edit_message_text(
@@ -228,7 +238,7 @@ async def follow_node_operator(update: Update, context: ContextTypes.DEFAULT_TYP
     ]
     text = FOLLOW_NODE_OPERATOR_TEXT
     if node_operator_ids:
-        text = FOLLOW_NODE_OPERATOR_FOLLOWING.format(', '.join(map(lambda x: f"#{x}", node_operator_ids))) + text
+        text = FOLLOW_NODE_OPERATOR_FOLLOWING.format(_format_node_operator_ids(node_operator_ids)) + text
     await query.edit_message_text(text=text, reply_markup=InlineKeyboardMarkup([keyboard]))
     return States.FOLLOW_NODE_OPERATOR
 
@@ -264,7 +274,7 @@ async def unfollow_node_operator(update: Update, context: ContextTypes.DEFAULT_T
         InlineKeyboardButton(BUTTON_BACK, callback_data=Callback.BACK)
     ]
     if node_operator_ids:
-        text = UNFOLLOW_NODE_OPERATOR_FOLLOWING.format(', '.join(map(lambda x: f"#{x}", node_operator_ids)))
+        text = UNFOLLOW_NODE_OPERATOR_FOLLOWING.format(_format_node_operator_ids(node_operator_ids))
         text += UNFOLLOW_NODE_OPERATOR_TEXT
     else:
         text = UNFOLLOW_NODE_OPERATOR_NOT_FOLLOWING
@@ -1,11 +1,12 @@
 import asyncio
 import logging
 import os
+import sys
 
 import signal
 from asyncio import BaseEventLoop
 
-from web3 import AsyncWeb3, WebSocketProvider
+from web3 import AsyncWeb3, Web3, WebSocketProvider
 from eth_utils import event_abi_to_log_topic, get_all_event_abis
 from web3._utils.events import get_event_data
 from web3._utils.filters import construct_event_filter_params
@@ -23,7 +24,8 @@ def topics_to_follow(*abis) -> dict:
     topics = {}
     for event in [event for abi in abis for event in get_all_event_abis(abi)]:
         if event["name"] in EVENTS_TO_FOLLOW.keys():
-            topics[event_abi_to_log_topic(event)] = event
+            # interned names let the dispatch dicts keyed by event name match on identity
+            topics[event_abi_to_log_topic(event)] = {**event, "name": sys.intern(event["name"])}
     return topics
 
 
@@ -32,6 +34,7 @@ class Subscription:
         super().__init__()
         self._shutdown_event = asyncio.Event()
         self._w3 = w3
+        self.csm_address = Web3.to_checksum_address(os.environ["CSM_ADDRESS"])
         self.abi_by_topics = topics_to_follow(CSM_ABI, FEE_DISTRIBUTOR_ABI, VEBO_ABI)
 
     @property
@@ -75,7 +78,7 @@ class Subscription:
     async def subscribe(self):
         async for w3 in self.w3:
             csm_filter = {
-                "address": os.getenv("CSM_ADDRESS"),
+                "address": self.csm_address,
             }
             _, vebo_filter = construct_event_filter_params(
                 get_event_abi(VEBO_ABI, "ValidatorExitRequest"),
@@ -101,8 +104,9 @@ class Subscription:
                         subscription_id_heads
                         )
 
+            is_shutting_down = self._shutdown_event.is_set
             async for payload in w3.socket.process_subscriptions():
-                if self._shutdown_event.is_set():
+                if is_shutting_down():
                     break
                 subscription_id = payload["subscription"]
                 result = payload["result"]
@@ -128,19 +132,17 @@ class Subscription:
             return
         logger.info(f"Processing blocks from %s to %s", start_block, current_block)
         # TODO add vebo address
-        for contract in [os.getenv("CSM_ADDRESS"), os.getenv("FEE_DISTRIBUTOR_ADDRESS")]:
+        for contract in [self.csm_address, os.getenv("FEE_DISTRIBUTOR_ADDRESS")]:
             filter_params = {
                 "fromBlock": start_block,
                 "toBlock": current_block,
                 "address": contract,
             }
             logs = await w3.eth.get_logs(filter_params)
-            for log in logs:
-                event_topic = log["topics"][0]
-                event_abi = self.abi_by_topics.get(event_topic)
-                if not event_abi:
-                    continue
-                event_data: EventData = get_event_data(w3.codec, event_abi, log)
+            abi_by_topics = self.abi_by_topics
+            matched = [(log, abi_by_topics[log["topics"][0]]) for log in logs if log["topics"][0] in abi_by_topics]
+            decoded: list[EventData] = [get_event_data(w3.codec, event_abi, log) for log, event_abi in matched]
+            for event_data in decoded:
                 await self.process_event_log(Event(event=event_data["event"],
                                                    args=event_data["args"],
                                                    block=event_data["blockNumber"],
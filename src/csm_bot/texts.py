@@ -1,22 +1,37 @@
+import functools
 import os
+import sys
+import types
 
-from aiogram.utils.formatting import Text, Bold, TextLink, Code
-from web3.constants import ADDRESS_ZERO
+from aiogram.utils.formatting import Text, Bold, TextLink
 
-markdown = lambda *args, **kwargs: Text(*args, **kwargs).as_markdown()
-nl = lambda x=2: "\n" * x
+ADDRESS_ZERO = "0x0000000000000000000000000000000000000000"
+_NL1 = "\n"
+_NL2 = "\n\n"
+_MARKDOWN_ESCAPE_TABLE = str.maketrans({char: "\\" + char for char in "_*[]()~`>#+-=|{}.!\\"})
 
 
-class RegisterEventMessage:
-    def __init__(self, event_name):
-        self.event_name = event_name
+def _escape(value) -> str:
+    """Escape a dynamic value the same way aiogram does for plain text and code entities."""
+    return str(value).translate(_MARKDOWN_ESCAPE_TABLE)
 
-    def __call__(self, func):
-        EVENT_MESSAGES[self.event_name] = func
-        return func
+
+def markdown(*args, **kwargs):
+    if not kwargs and all(type(arg) is str for arg in args):
+        # plain strings carry no entities, so rendering them is just escaping
+        return _escape("".join(args))
+    return Text(*args, **kwargs).as_markdown()
+
+
+_CSM_UI_LINK = TextLink("CSM UI", url=os.getenv("CSM_UI_URL"))
+_MEV_STEALING_GUIDE_LINK = TextLink("guide", url="https://docs.lido.fi/staking-modules/csm/guides/mev-stealing")
+_SLASHING_GUIDE_LINK = TextLink("guide", url="https://docs.lido.fi/staking-modules/csm/guides/slashing")
+_EXITING_GUIDE_LINK = TextLink(
+    "Exiting CSM validators",
+    url="https://dvt-homestaker.stakesaurus.com/bonded-validators-setup/lido-csm/exiting-csm-validators",
+)
 
 
-EVENT_MESSAGES = {}
 EVENT_DESCRIPTIONS = {
     "DepositedSigningKeysCountChanged": "- 🤩 Node Operator's keys received deposits",
     "ELRewardsStealingPenaltyReported": "- 🚨 Penalty for stealing EL rewards reported",
@@ -37,210 +52,287 @@ EVENT_DESCRIPTIONS = {
     "DistributionDataUpdated": "- 📈 New rewards distributed",
     "TargetValidatorsCountChanged": "- 🚨 Target validators count changed",
 }
-
-EVENT_LIST_TEXT = markdown(
-    "Here is the list of events you will receive notifications for:", nl(1),
-    "A 🚨 means urgent action is required from you", nl(),
-    Bold("Key Management Events:"), nl(1), "Changes related to keys and their status.", nl(1),
-    EVENT_DESCRIPTIONS["VettedSigningKeysCountDecreased"], nl(1),
-    EVENT_DESCRIPTIONS["StuckSigningKeysCountChanged"], nl(1),
-    EVENT_DESCRIPTIONS["DepositedSigningKeysCountChanged"], nl(1),
-    EVENT_DESCRIPTIONS["TotalSigningKeysCountChanged"], nl(1),
-    EVENT_DESCRIPTIONS["KeyRemovalChargeApplied"], nl(1),
-    EVENT_DESCRIPTIONS["TargetValidatorsCountChanged"], nl(),
-    Bold("Address and Reward Changes:"), nl(1), "Changes or proposals regarding management and reward addresses.",
-    nl(1),
-    EVENT_DESCRIPTIONS["NodeOperatorManagerAddressChangeProposed"], nl(1),
-    EVENT_DESCRIPTIONS["NodeOperatorManagerAddressChanged"], nl(1),
-    EVENT_DESCRIPTIONS["NodeOperatorRewardAddressChangeProposed"], nl(1),
-    EVENT_DESCRIPTIONS["NodeOperatorRewardAddressChanged"], nl(),
-    Bold("Slashing and Stealing Events:"), nl(1), "Alerts for validator status and MEV stealing penalties.", nl(1),
-    EVENT_DESCRIPTIONS["InitialSlashingSubmitted"], nl(1),
-    EVENT_DESCRIPTIONS["ELRewardsStealingPenaltyReported"], nl(1),
-    EVENT_DESCRIPTIONS["ELRewardsStealingPenaltySettled"], nl(1),
-    EVENT_DESCRIPTIONS["ELRewardsStealingPenaltyCancelled"], nl(),
-    Bold("Withdrawal and Exit Requests:"), nl(1), "Notifications for exit requests and confirmation of exits.", nl(1),
-    EVENT_DESCRIPTIONS["ValidatorExitRequest"], nl(1),
-    EVENT_DESCRIPTIONS["WithdrawalSubmitted"], nl(),
-    Bold("Common CSM Events for all the Node Operators:"), nl(1),
-    EVENT_DESCRIPTIONS["DistributionDataUpdated"], nl(1),
-    EVENT_DESCRIPTIONS["PublicRelease"], nl(),
+EVENT_DESCRIPTIONS = types.MappingProxyType({
+    event: sys.intern(description) for event, description in EVENT_DESCRIPTIONS.items()
+})
+
+_EVENT_LIST_SECTIONS = (
+    ("Key Management Events:", "Changes related to keys and their status.", (
+        "VettedSigningKeysCountDecreased",
+        "StuckSigningKeysCountChanged",
+        "DepositedSigningKeysCountChanged",
+        "TotalSigningKeysCountChanged",
+        "KeyRemovalChargeApplied",
+        "TargetValidatorsCountChanged",
+    )),
+    ("Address and Reward Changes:", "Changes or proposals regarding management and reward addresses.", (
+        "NodeOperatorManagerAddressChangeProposed",
+        "NodeOperatorManagerAddressChanged",
+        "NodeOperatorRewardAddressChangeProposed",
+        "NodeOperatorRewardAddressChanged",
+    )),
+    ("Slashing and Stealing Events:", "Alerts for validator status and MEV stealing penalties.", (
+        "InitialSlashingSubmitted",
+        "ELRewardsStealingPenaltyReported",
+        "ELRewardsStealingPenaltySettled",
+        "ELRewardsStealingPenaltyCancelled",
+    )),
+    ("Withdrawal and Exit Requests:", "Notifications for exit requests and confirmation of exits.", (
+        "ValidatorExitRequest",
+        "WithdrawalSubmitted",
+    )),
+    ("Common CSM Events for all the Node Operators:", None, (
+        "DistributionDataUpdated",
+        "PublicRelease",
+    )),
 )
 
-WELCOME_TEXT = ("Welcome to the CSM Sentinel! " + nl() +
-                "Here you can follow Node Operators and receive notifications about their events." + nl() +
-                "To get started, please use the buttons below." + nl())
+
+def _event_list_section(title, description, events):
+    lines = [f"*{_escape(title)}*"]
+    if description:
+        lines.append(_escape(description))
+    lines.extend(_escape(EVENT_DESCRIPTIONS[event]) for event in events)
+    return _NL1.join(lines)
+
+
+EVENT_LIST_TEXT = _NL2.join([
+    _escape("Here is the list of events you will receive notifications for:\n"
+            "A 🚨 means urgent action is required from you"),
+    *(_event_list_section(*section) for section in _EVENT_LIST_SECTIONS),
+]) + _NL2
+
+WELCOME_TEXT = ("Welcome to the CSM Sentinel! \n\n"
+                "Here you can follow Node Operators and receive notifications about their events.\n\n"
+                "To get started, please use the buttons below.\n\n")
 START_BUTTON_FOLLOW = "Follow"
 START_BUTTON_UNFOLLOW = "Unfollow"
 START_BUTTON_EVENTS = "Events"
 BUTTON_BACK = "Back"
 FOLLOW_NODE_OPERATOR_TEXT = "Please enter the Node Operator id you want to follow:"
-FOLLOW_NODE_OPERATOR_FOLLOWING = "Node Operators you are following: {}" + nl()
+FOLLOW_NODE_OPERATOR_FOLLOWING = "Node Operators you are following: {}\n\n"
 UNFOLLOW_NODE_OPERATOR_TEXT = "Please enter the Node Operator id you want to unfollow:"
 UNFOLLOW_NODE_OPERATOR_NOT_FOLLOWING = "You are not following any Node Operators."
-UNFOLLOW_NODE_OPERATOR_FOLLOWING = "Node Operators you are following: {}" + nl()
+UNFOLLOW_NODE_OPERATOR_FOLLOWING = "Node Operators you are following: {}\n\n"
 NODE_OPERATOR_FOLLOWED = "You are now following Node Operator #{}"
 NODE_OPERATOR_CANT_FOLLOW = "Invalid Node Operator id. Please enter the correct id."
 NODE_OPERATOR_UNFOLLOWED = "You are no longer following Node Operator #{}"
 NODE_OPERATOR_CANT_UNFOLLOW = "Can't unfollow the Node Operator you are not following. \nPlease enter the correct id."
 EVENT_EMITS = "Event {} emitted with data: \n{}"
 
-EVENT_MESSAGE_FOOTER = lambda noId, link: Text(nl(), f"nodeOperatorId: {noId}\n", TextLink("Transaction", url=link))
-EVENT_MESSAGE_FOOTER_TX_ONLY = lambda x: Text(nl(), TextLink("Transaction", url=x))
+
+def event_message_footer(no_id, link):
+    return f"{_NL2}nodeOperatorId: {_escape(no_id)}{_NL1}[Transaction]({link})"
+
+
+def event_message_footer_tx_only(link):
+    return f"{_NL2}[Transaction]({link})"
 
 
-@RegisterEventMessage("DepositedSigningKeysCountChanged")
+_DEPOSITED_HEADER = markdown("🤩 ", Bold("Keys were deposited!"), _NL2)
+
+
+@functools.lru_cache(maxsize=1024)
 def deposited_signing_keys_count_changed(x):
-    return markdown("🤩 ", Bold("Keys were deposited!"), nl(), f"New deposited keys count: {x}")
+    return f"{_DEPOSITED_HEADER}New deposited keys count: {_escape(x)}"
+
+
+_PENALTY_CANCELLED_HEADER = markdown("😮‍💨 ", Bold("EL rewards stealing penalty cancelled"), _NL2)
 
 
-@RegisterEventMessage("ELRewardsStealingPenaltyCancelled")
 def el_rewards_stealing_penalty_cancelled(remaining):
-    return markdown("😮‍💨 ", Bold("EL rewards stealing penalty cancelled"), nl(),
-                    "Remaining amount: ", Code(remaining))
+    return f"{_PENALTY_CANCELLED_HEADER}Remaining amount: `{_escape(remaining)}`"
+
+
+_PENALTY_REPORTED_HEADER = markdown("🚨 ", Bold("Penalty for stealing EL rewards reported"), _NL2)
+_PENALTY_REPORTED_FOOTER = markdown(" were transferred to the wrong EL address", _NL1,
+                                    "See the ", _MEV_STEALING_GUIDE_LINK, " for more details")
 
 
-@RegisterEventMessage("ELRewardsStealingPenaltyReported")
 def el_rewards_stealing_penalty_reported(rewards, block_link):
-    return markdown("🚨 ", Bold("Penalty for stealing EL rewards reported"), nl(),
-                    Code(rewards), " rewards from the ", TextLink("block", url=block_link),
-                    " were transferred to the wrong EL address", nl(1),
-                    "See the ", TextLink("guide", url="https://docs.lido.fi/staking-modules/csm/guides/mev-stealing"),
-                    " for more details")
+    return (f"{_PENALTY_REPORTED_HEADER}`{_escape(rewards)}` rewards from the [block]({block_link})"
+            f"{_PENALTY_REPORTED_FOOTER}")
+
+
+_PENALTY_SETTLED_HEADER = markdown("🚨 ", Bold("EL rewards stealing penalty confirmed and applied"), _NL2)
 
 
-@RegisterEventMessage("ELRewardsStealingPenaltySettled")
 def el_rewards_stealing_penalty_settled(burnt):
-    return markdown("🚨 ", Bold("EL rewards stealing penalty confirmed and applied"), nl(),
-                    Code(burnt), " burnt from bond")
+    return f"{_PENALTY_SETTLED_HEADER}`{_escape(burnt)}` burnt from bond"
+
+
+_INITIAL_SLASHING_HEADER = markdown("🚨 ", Bold("Initial slashing submitted for one of the validators"), _NL2)
+_INITIAL_SLASHING_FOOTER = markdown(_NL1, "See the ", _SLASHING_GUIDE_LINK, " for more details")
 
 
-@RegisterEventMessage("InitialSlashingSubmitted")
 def initial_slashing_submitted(key, key_url):
-    return markdown("🚨 ", Bold("Initial slashing submitted for one of the validators"), nl(),
-                    "Slashed key: ", TextLink(key, url=key_url), nl(1),
-                    "See the ", TextLink("guide", url="https://docs.lido.fi/staking-modules/csm/guides/slashing"),
-                    " for more details")
+    return f"{_INITIAL_SLASHING_HEADER}Slashed key: [{_escape(key)}]({key_url}){_INITIAL_SLASHING_FOOTER}"
+
+
+_KEY_REMOVAL_CHARGE_HEADER = markdown("🔑 ", Bold("Key removal charge applied"), _NL2)
 
 
-@RegisterEventMessage("KeyRemovalChargeApplied")
+@functools.lru_cache(maxsize=1024)
 def key_removal_charge_applied(amount):
-    return markdown("🔑 ", Bold("Key removal charge applied"), nl(),
-                    "Amount of charge: ", Code(amount))
+    return f"{_KEY_REMOVAL_CHARGE_HEADER}Amount of charge: `{_escape(amount)}`"
 
 
-@RegisterEventMessage("NodeOperatorManagerAddressChangeProposed")
+_CONFIRM_ADDRESS_CHANGE = markdown("To complete the change, the Node Operator must confirm it from the new address.")
+_MANAGER_ADDRESS_REVOKED = markdown("ℹ️ ", Bold("Proposed manager address revoked"))
+_MANAGER_ADDRESS_PROPOSED_HEADER = markdown("ℹ️ ", Bold("New manager address proposed"), _NL2)
+
+
+@functools.lru_cache(maxsize=1024)
 def node_operator_manager_address_change_proposed(address):
     if address == ADDRESS_ZERO:
-        return markdown("ℹ️ ", Bold("Proposed manager address revoked"))
+        return _MANAGER_ADDRESS_REVOKED
     else:
-        return markdown("ℹ️ ", Bold("New manager address proposed"), nl(),
-                        "Proposed address: ", Code(address), nl(1),
-                        "To complete the change, the Node Operator must confirm it from the new address.")
+        return f"{_MANAGER_ADDRESS_PROPOSED_HEADER}Proposed address: `{_escape(address)}`{_NL1}{_CONFIRM_ADDRESS_CHANGE}"
+
 
+_MANAGER_ADDRESS_CHANGED_HEADER = markdown("✅ ", Bold("Manager address changed"), _NL2)
 
-@RegisterEventMessage("NodeOperatorManagerAddressChanged")
+
+@functools.lru_cache(maxsize=1024)
 def node_operator_manager_address_changed(address):
-    return markdown("✅ ", Bold("Manager address changed"), nl(),
-                    "New address: ", Code(address))
+    return f"{_MANAGER_ADDRESS_CHANGED_HEADER}New address: `{_escape(address)}`"
+
+
+_REWARD_ADDRESS_REVOKED = markdown("ℹ️ ", Bold("Proposed reward address revoked"))
+_REWARD_ADDRESS_PROPOSED_HEADER = markdown("ℹ️ ", Bold("New rewards address proposed"), _NL2)
 
 
-@RegisterEventMessage("NodeOperatorRewardAddressChangeProposed")
+@functools.lru_cache(maxsize=1024)
 def node_operator_reward_address_change_proposed(address):
     if address == ADDRESS_ZERO:
-        return markdown("ℹ️ ", Bold("Proposed reward address revoked"))
+        return _REWARD_ADDRESS_REVOKED
     else:
-        return markdown("ℹ️ ", Bold("New rewards address proposed"), nl(),
-                        "Proposed address: ", Code(address),
-                        "To complete the change, the Node Operator must confirm it from the new address.")
+        return f"{_REWARD_ADDRESS_PROPOSED_HEADER}Proposed address: `{_escape(address)}`{_CONFIRM_ADDRESS_CHANGE}"
 
 
-@RegisterEventMessage("NodeOperatorRewardAddressChanged")
+_REWARD_ADDRESS_CHANGED_HEADER = markdown("✅ ", Bold("Rewards address changed"), _NL2)
+
+
+@functools.lru_cache(maxsize=1024)
 def node_operator_reward_address_changed(address):
-    return markdown("✅ ", Bold("Rewards address changed"), nl(),
-                    "New address: ", Code(address))
+    return f"{_REWARD_ADDRESS_CHANGED_HEADER}New address: `{_escape(address)}`"
+
 
+_STUCK_KEYS_HEADER = markdown("🚨 ", Bold("Stuck keys reported"), _NL2)
+_STUCK_KEYS_FOOTER = markdown(" key(s) were not exited in time. Check ", _CSM_UI_LINK, " for more details")
 
-@RegisterEventMessage("StuckSigningKeysCountChanged")
+
+@functools.lru_cache(maxsize=1024)
 def stuck_signing_keys_count_changed(count):
-    return markdown("🚨 ", Bold("Stuck keys reported"), nl(),
-                    Code(count), " key(s) were not exited in time. Check ",
-                    TextLink("CSM UI", url=os.getenv("CSM_UI_URL")), " for more details")
+    return f"{_STUCK_KEYS_HEADER}`{_escape(count)}`{_STUCK_KEYS_FOOTER}"
+
+
+_VETTED_KEYS_DECREASED = markdown("🚨 ", Bold("Vetted keys count decreased"), _NL2,
+                                  "Consider removing invalid keys. Check ",
+                                  _CSM_UI_LINK, " for more details")
 
 
-@RegisterEventMessage("VettedSigningKeysCountDecreased")
 def vetted_signing_keys_count_decreased():
-    return markdown("🚨 ", Bold("Vetted keys count decreased"), nl(),
-                    "Consider removing invalid keys. Check ",
-                    TextLink("CSM UI", url=os.getenv("CSM_UI_URL")), " for more details")
+    return _VETTED_KEYS_DECREASED
+
+
+_WITHDRAWAL_SUBMITTED_HEADER = markdown("👀 ", Bold("Information about validator withdrawal has been submitted"), _NL2)
+_WITHDRAWAL_SUBMITTED_FOOTER = markdown(_NL2, "Check the amount of the bond released at ", _CSM_UI_LINK)
 
 
-@RegisterEventMessage("WithdrawalSubmitted")
 def withdrawal_submitted(key, key_url, amount):
-    return markdown("👀 ", Bold("Information about validator withdrawal has been submitted"), nl(),
-                    "Withdrawn key: ", TextLink(key, url=key_url),
-                    " with exit balance: ", Code(amount), nl(),
-                    "Check the amount of the bond released at ", TextLink("CSM UI", url=os.getenv("CSM_UI_URL")))
+    return (f"{_WITHDRAWAL_SUBMITTED_HEADER}Withdrawn key: [{_escape(key)}]({key_url})"
+            f" with exit balance: `{_escape(amount)}`{_WITHDRAWAL_SUBMITTED_FOOTER}")
+
 
+_KEYS_UPLOADED_HEADER = markdown("👀 ", Bold("New keys uploaded"), _NL2)
+_KEY_REMOVED_HEADER = markdown("🚨 ", Bold("Key removed"), _NL2)
 
-@RegisterEventMessage("TotalSigningKeysCountChanged")
+
+@functools.lru_cache(maxsize=1024)
 def total_signing_keys_count_changed(count, count_before):
     if count > count_before:
-        return markdown("👀 ", Bold("New keys uploaded"), nl(),
-                        "Keys count: ", Code(f"{count_before} -> {count}"))
+        return f"{_KEYS_UPLOADED_HEADER}Keys count: `{_escape(count_before)} \\-\\> {_escape(count)}`"
     else:
-        return markdown("🚨 ", Bold("Key removed"), nl(),
-                        "Total keys: ", Code(count))
+        return f"{_KEY_REMOVED_HEADER}Total keys: `{_escape(count)}`"
+
+
+_VALIDATOR_EXIT_REQUEST_HEADER = markdown("🚨 ", Bold("Validator exit requested"), _NL2,
+                                          "Make sure to exit the key before ")
+_VALIDATOR_EXIT_REQUEST_GUIDE = markdown(_NL1, "Check the ", _EXITING_GUIDE_LINK, " guide for more details", _NL1)
 
 
-@RegisterEventMessage("ValidatorExitRequest")
 def validator_exit_request(key, key_url, request_date, exit_until):
-    return markdown("🚨 ", Bold("Validator exit requested"), nl(),
-                    "Make sure to exit the key before ", exit_until, nl(1),
-                    "Check the ", TextLink("Exiting CSM validators",
-                                           url="https://dvt-homestaker.stakesaurus.com/bonded-validators-setup/lido-csm/exiting-csm-validators"),
-                    " guide for more details", nl(1),
-                    "Requested key: ", TextLink(key, url=key_url), nl(1),
-                    "Request date: ", Code(request_date))
+    return (f"{_VALIDATOR_EXIT_REQUEST_HEADER}{_escape(exit_until)}{_VALIDATOR_EXIT_REQUEST_GUIDE}"
+            f"Requested key: [{_escape(key)}]({key_url}){_NL1}"
+            f"Request date: `{_escape(request_date)}`")
+
+
+_PUBLIC_RELEASE = markdown("🎉 ", Bold("Public release of CSM is here!"), _NL2,
+                           "Now everyone can join the CSM and upload any number of keys.")
 
 
-@RegisterEventMessage("PublicRelease")
 def public_release():
-    return markdown("🎉 ", Bold("Public release of CSM is here!"), nl(),
-                    "Now everyone can join the CSM and upload any number of keys.")
+    return _PUBLIC_RELEASE
+
+
+_DISTRIBUTION_DATA_UPDATED = markdown("📈 ", Bold("Rewards distributed!"), _NL2,
+                                      "Follow the ", _CSM_UI_LINK,
+                                      " to check new claimable rewards.")
 
 
-@RegisterEventMessage("DistributionDataUpdated")
 def distribution_data_updated():
-    return markdown("📈 ", Bold("Rewards distributed!"), nl(),
-                    "Follow the ", TextLink("CSM UI", url=os.getenv("CSM_UI_URL")),
-                    " to check new claimable rewards.")
+    return _DISTRIBUTION_DATA_UPDATED
+
+
+_TARGET_LIMIT_HEADER = markdown("🚨 ", Bold("Target validators count changed"), _NL2)
+_TARGET_LIMIT_ZERO = _TARGET_LIMIT_HEADER + "The limit has been set to zero\\. No keys will be requested to exit\\."
+# mode_after -> (limit set, limit decreased within the same mode)
+_TARGET_LIMIT_TEMPLATES = {
+    1: (_TARGET_LIMIT_HEADER + "The limit has been set to {after}\\.\n"
+                               "{after} keys will be requested to exit first\\.",
+        _TARGET_LIMIT_HEADER + "The limit has been decreased from {before} to {after}\\.\n"
+                               "{diff} more key\\(s\\) will be requested to exit first\\."),
+    2: (_TARGET_LIMIT_HEADER + "The limit has been set to {after}\\.\n"
+                               "{after} keys will be requested to exit immediately\\.",
+        _TARGET_LIMIT_HEADER + "The limit has been decreased from {before} to {after}\\.\n"
+                               "{diff} more key\\(s\\) will be requested to exit immediately\\."),
+}
 
 
-@RegisterEventMessage("TargetValidatorsCountChanged")
+@functools.lru_cache(maxsize=1024)
 def target_validators_count_changed(mode_before, limit_before, mode_after, limit_after):
-    match (mode_before, limit_before, mode_after, limit_after):
-        case (1, _, 1, limit_after) if limit_after < limit_before:
-            return markdown("🚨 ", Bold("Target validators count changed"), nl(),
-                            f"The limit has been decreased from {limit_before} to {limit_after}.", nl(1),
-                            f"{limit_before - limit_after} more key(s) will be requested to exit first.")
-        case (2, _, 2, limit_after) if limit_after < limit_before:
-            return markdown("🚨 ", Bold("Target validators count changed"), nl(),
-                            f"The limit has been decreased from {limit_before} to {limit_after}.", nl(1),
-                            f"{limit_before - limit_after} more key(s) will be requested to exit immediately.")
-        case (_, _, 1, _):
-            return markdown("🚨 ", Bold("Target validators count changed"), nl(),
-                            f"The limit has been set to {limit_after}.", nl(1),
-                            f"{limit_after} keys will be requested to exit first.")
-        case (_, _, 2, _):
-            return markdown("🚨 ", Bold("Target validators count changed"), nl(),
-                            f"The limit has been set to {limit_after}.", nl(1),
-                            f"{limit_after} keys will be requested to exit immediately.")
-        case (_, _, 0, _):
-            return markdown("🚨 ", Bold("Target validators count changed"), nl(),
-                            "The limit has been set to zero. No keys will be requested to exit.")
-        case _:
-            # is there any case for this?
-            return markdown("🚨 ", Bold("Target validators count changed"), nl(),
-                            f"Mode changed from {mode_before} to {mode_after}.", nl(1),
-                            f"Limit changed from {limit_before} to {limit_after}.")
\ No newline at end of file
+    if mode_after == 0:
+        return _TARGET_LIMIT_ZERO
+    templates = _TARGET_LIMIT_TEMPLATES.get(mode_after)
+    if templates is None:
+        # is there any case for this?
+        return markdown("🚨 ", Bold("Target validators count changed"), _NL2,
+                        f"Mode changed from {mode_before} to {mode_after}.", _NL1,
+                        f"Limit changed from {limit_before} to {limit_after}.")
+    limit_set, limit_decreased = templates
+    if mode_before == mode_after and limit_after < limit_before:
+        return limit_decreased.format(before=limit_before, after=limit_after, diff=limit_before - limit_after)
+    return limit_set.format(after=limit_after)
+
+
+EVENT_MESSAGES = {
+    "DepositedSigningKeysCountChanged": deposited_signing_keys_count_changed,
+    "ELRewardsStealingPenaltyCancelled": el_rewards_stealing_penalty_cancelled,
+    "ELRewardsStealingPenaltyReported": el_rewards_stealing_penalty_reported,
+    "ELRewardsStealingPenaltySettled": el_rewards_stealing_penalty_settled,
+    "InitialSlashingSubmitted": initial_slashing_submitted,
+    "KeyRemovalChargeApplied": key_removal_charge_applied,
+    "NodeOperatorManagerAddressChangeProposed": node_operator_manager_address_change_proposed,
+    "NodeOperatorManagerAddressChanged": node_operator_manager_address_changed,
+    "NodeOperatorRewardAddressChangeProposed": node_operator_reward_address_change_proposed,
+    "NodeOperatorRewardAddressChanged": node_operator_reward_address_changed,
+    "StuckSigningKeysCountChanged": stuck_signing_keys_count_changed,
+    "VettedSigningKeysCountDecreased": vetted_signing_keys_count_decreased,
+    "WithdrawalSubmitted": withdrawal_submitted,
+    "TotalSigningKeysCountChanged": total_signing_keys_count_changed,
+    "ValidatorExitRequest": validator_exit_request,
+    "PublicRelease": public_release,
+    "DistributionDataUpdated": distribution_data_updated,
+    "TargetValidatorsCountChanged": target_validators_count_changed,
+}
@@ -1,56 +1,49 @@
-from src.csm_bot.texts import target_validators_count_changed
-
-def test_limit_set_mode_1():
-    result = target_validators_count_changed(0, 0, 1, 10)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been set to 10\.\n"
-                "10 keys will be requested to exit first\.")
-    assert result == expected
-
-def test_limit_set_mode_2():
-    result = target_validators_count_changed(0, 0, 2, 10)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been set to 10\.\n"
-                "10 keys will be requested to exit immediately\.")
-    assert result == expected
-
-def test_limit_set_mode_2_from_1():
-    result = target_validators_count_changed(1, 5, 2, 10)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been set to 10\.\n"
-                "10 keys will be requested to exit immediately\.")
-    assert result == expected
-
-def test_limit_set_mode_1_from_2():
-    result = target_validators_count_changed(2, 5, 1, 10)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been set to 10\.\n"
-                "10 keys will be requested to exit first\.")
-    assert result == expected
-
-
-def test_limit_decreased_mode_1():
-    result = target_validators_count_changed(1, 10, 1, 3)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been decreased from 10 to 3\.\n"
-                "7 more key\(s\) will be requested to exit first\.")
-    assert result == expected
-
-def test_limit_decreased_mode_2():
-    result = target_validators_count_changed(2, 10, 2, 3)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been decreased from 10 to 3\.\n"
-                "7 more key\(s\) will be requested to exit immediately\.")
-    assert result == expected
-
-def test_limit_unset_1():
-    result = target_validators_count_changed(1, 10, 0, 0)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been set to zero\. No keys will be requested to exit\.")
-    assert result == expected
-
-def test_limit_unset_2():
-    result = target_validators_count_changed(2, 10, 0, 0)
-    expected = ("🚨 *Target validators count changed*\n\n"
-                "The limit has been set to zero\. No keys will be requested to exit\.")
-    assert result == expected
+import pytest
+
+from src.csm_bot.texts import (
+    target_validators_count_changed, deposited_signing_keys_count_changed,
+    node_operator_manager_address_change_proposed,
+)
+
+_HEADER = "🚨 *Target validators count changed*\n\n"
+_LIMIT_SET = "The limit has been set to {limit}\\.\n{limit} keys will be requested to exit {when}\\."
+_LIMIT_DECREASED = ("The limit has been decreased from {before} to {after}\\.\n"
+                    "{diff} more key\\(s\\) will be requested to exit {when}\\.")
+
+_EXPECT_LIMIT_SET_FIRST = _HEADER + _LIMIT_SET.format(limit=10, when="first")
+_EXPECT_LIMIT_SET_IMMEDIATELY = _HEADER + _LIMIT_SET.format(limit=10, when="immediately")
+_EXPECT_LIMIT_DECREASED_FIRST = _HEADER + _LIMIT_DECREASED.format(before=10, after=3, diff=7, when="first")
+_EXPECT_LIMIT_DECREASED_IMMEDIATELY = _HEADER + _LIMIT_DECREASED.format(before=10, after=3, diff=7,
+                                                                        when="immediately")
+_EXPECT_LIMIT_UNSET = _HEADER + "The limit has been set to zero\\. No keys will be requested to exit\\."
+
+@pytest.mark.parametrize("mode_before, limit_before, mode_after, limit_after, expected", [
+    pytest.param(0, 0, 1, 10, _EXPECT_LIMIT_SET_FIRST, id="set_mode_1"),
+    pytest.param(0, 0, 2, 10, _EXPECT_LIMIT_SET_IMMEDIATELY, id="set_mode_2"),
+    pytest.param(1, 5, 2, 10, _EXPECT_LIMIT_SET_IMMEDIATELY, id="set_mode_2_from_1"),
+    pytest.param(2, 5, 1, 10, _EXPECT_LIMIT_SET_FIRST, id="set_mode_1_from_2"),
+    pytest.param(1, 10, 1, 3, _EXPECT_LIMIT_DECREASED_FIRST, id="decreased_mode_1"),
+    pytest.param(2, 10, 2, 3, _EXPECT_LIMIT_DECREASED_IMMEDIATELY, id="decreased_mode_2"),
+    pytest.param(1, 10, 0, 0, _EXPECT_LIMIT_UNSET, id="unset_1"),
+    pytest.param(2, 10, 0, 0, _EXPECT_LIMIT_UNSET, id="unset_2"),
+])
+def test_limit(mode_before, limit_before, mode_after, limit_after, expected):
+    result = target_validators_count_changed(mode_before, limit_before, mode_after, limit_after)
+    assert result == expected
+
+def test_deposited_keys_count_escaped():
+    result = deposited_signing_keys_count_changed("1.5")
+    expected = ("🤩 *Keys were deposited\\!*\n\n"
+                "New deposited keys count: 1\\.5")
+    assert result == expected
+
+def test_manager_address_change_proposed():
+    result = node_operator_manager_address_change_proposed("0x00000000000000000000000000000000000000_1")
+    expected = ("ℹ️ *New manager address proposed*\n\n"
+                "Proposed address: `0x00000000000000000000000000000000000000\\_1`\n"
+                "To complete the change, the Node Operator must confirm it from the new address\\.")
+    assert result == expected
+
+def test_manager_address_change_revoked():
+    result = node_operator_manager_address_change_proposed("0x0000000000000000000000000000000000000000")
+    assert result == "ℹ️ *Proposed manager address revoked*"